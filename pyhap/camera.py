@@ -17,10 +17,12 @@ streaming.
 """
 
 import asyncio
+from base64 import b64encode
 import functools
 import ipaddress
 import logging
 import os
+import string
 import struct
 from uuid import UUID
 
@@ -207,24 +209,224 @@ SET_CONFIG_REQUEST_TAG = b'\x02'
 SESSION_ID = b'\x01'
 
 
+# Shorthands for the TLV tags and values used when negotiating a stream.
+_SETUP_SESSION_ID = SETUP_TYPES['SESSION_ID']
+_SETUP_ADDRESS = SETUP_TYPES['ADDRESS']
+_SETUP_VIDEO_SRTP_PARAM = SETUP_TYPES['VIDEO_SRTP_PARAM']
+_SETUP_AUDIO_SRTP_PARAM = SETUP_TYPES['AUDIO_SRTP_PARAM']
+_SETUP_STATUS = SETUP_TYPES['STATUS']
+_SETUP_VIDEO_SSRC = SETUP_TYPES['VIDEO_SSRC']
+_SETUP_AUDIO_SSRC = SETUP_TYPES['AUDIO_SSRC']
+
+_SRTP_PARAM_CRYPTO = SETUP_SRTP_PARAM['CRYPTO']
+_SRTP_PARAM_MASTER_KEY = SETUP_SRTP_PARAM['MASTER_KEY']
+_SRTP_PARAM_MASTER_SALT = SETUP_SRTP_PARAM['MASTER_SALT']
+
+_ADDR_INFO_ADDRESS_VER = SETUP_ADDR_INFO['ADDRESS_VER']
+_ADDR_INFO_ADDRESS = SETUP_ADDR_INFO['ADDRESS']
+_ADDR_INFO_VIDEO_RTP_PORT = SETUP_ADDR_INFO['VIDEO_RTP_PORT']
+_ADDR_INFO_AUDIO_RTP_PORT = SETUP_ADDR_INFO['AUDIO_RTP_PORT']
+
+_SELECTED_VIDEO = SELECTED_STREAM_CONFIGURATION_TYPES['VIDEO']
+_SELECTED_AUDIO = SELECTED_STREAM_CONFIGURATION_TYPES['AUDIO']
+_SELECTED_SESSION = SELECTED_STREAM_CONFIGURATION_TYPES['SESSION']
+
+_RTP_PARAM_SYNCHRONIZATION_SOURCE = RTP_PARAM_TYPES['SYNCHRONIZATION_SOURCE']
+_RTP_PARAM_PAYLOAD_TYPE = RTP_PARAM_TYPES['PAYLOAD_TYPE']
+_RTP_PARAM_MAX_BIT_RATE = RTP_PARAM_TYPES['MAX_BIT_RATE']
+_RTP_PARAM_RTCP_SEND_INTERVAL = RTP_PARAM_TYPES['RTCP_SEND_INTERVAL']
+_RTP_PARAM_MAX_MTU = RTP_PARAM_TYPES['MAX_MTU']
+_RTP_PARAM_COMFORT_NOISE_PAYLOAD_TYPE = RTP_PARAM_TYPES['COMFORT_NOISE_PAYLOAD_TYPE']
+
+_VIDEO_CODEC = VIDEO_TYPES['CODEC']
+_VIDEO_CODEC_PARAM = VIDEO_TYPES['CODEC_PARAM']
+_VIDEO_ATTRIBUTES = VIDEO_TYPES['ATTRIBUTES']
+_VIDEO_RTP_PARAM = VIDEO_TYPES['RTP_PARAM']
+
+_VIDEO_CODEC_PARAM_PROFILE_ID = VIDEO_CODEC_PARAM_TYPES['PROFILE_ID']
+_VIDEO_CODEC_PARAM_LEVEL = VIDEO_CODEC_PARAM_TYPES['LEVEL']
+_VIDEO_CODEC_PARAM_PACKETIZATION_MODE = VIDEO_CODEC_PARAM_TYPES['PACKETIZATION_MODE']
+
+_VIDEO_CODEC_H264 = VIDEO_CODEC_TYPES['H264']
+_PACKETIZATION_MODE_NON_INTERLEAVED = \
+    VIDEO_CODEC_PARAM_PACKETIZATION_MODE_TYPES['NON_INTERLEAVED']
+
+_VIDEO_ATTR_IMAGE_WIDTH = VIDEO_ATTRIBUTES_TYPES['IMAGE_WIDTH']
+_VIDEO_ATTR_IMAGE_HEIGHT = VIDEO_ATTRIBUTES_TYPES['IMAGE_HEIGHT']
+_VIDEO_ATTR_FRAME_RATE = VIDEO_ATTRIBUTES_TYPES['FRAME_RATE']
+
+_AUDIO_CODEC = AUDIO_TYPES['CODEC']
+_AUDIO_CODEC_PARAM = AUDIO_TYPES['CODEC_PARAM']
+_AUDIO_RTP_PARAM = AUDIO_TYPES['RTP_PARAM']
+_AUDIO_COMFORT_NOISE = AUDIO_TYPES['COMFORT_NOISE']
+
+_AUDIO_CODEC_PARAM_CHANNEL = AUDIO_CODEC_PARAM_TYPES['CHANNEL']
+_AUDIO_CODEC_PARAM_BIT_RATE = AUDIO_CODEC_PARAM_TYPES['BIT_RATE']
+_AUDIO_CODEC_PARAM_SAMPLE_RATE = AUDIO_CODEC_PARAM_TYPES['SAMPLE_RATE']
+_AUDIO_CODEC_PARAM_PACKET_TIME = AUDIO_CODEC_PARAM_TYPES['PACKET_TIME']
+
+_SRTP_SUITE_AES_CM_128_HMAC_SHA1_80 = SRTP_CRYPTO_SUITES['AES_CM_128_HMAC_SHA1_80']
+
+_SETUP_STATUS_SUCCESS = SETUP_STATUS['SUCCESS']
+
+_STREAMING_STATUS_STREAMING = STREAMING_STATUS['STREAMING']
+_STREAMING_STATUS_AVAILABLE = STREAMING_STATUS['AVAILABLE']
+
+_STREAMING_STATUS_TAG = b'\x01'
+_SESSION_COMMAND = b'\x02'
+_AUDIO_CHANNELS_MONO = b'\x01'
+
+_SETUP_STATUS_SUCCESS_TLV = tlv.encode(_SETUP_STATUS, _SETUP_STATUS_SUCCESS)
+
+# Names of the H.264 profiles and levels, as understood by ffmpeg.
+_VIDEO_PROFILE_NAMES = {
+    VIDEO_CODEC_PARAM_PROFILE_ID_TYPES['BASELINE']: 'baseline',
+    VIDEO_CODEC_PARAM_PROFILE_ID_TYPES['MAIN']: 'main',
+    VIDEO_CODEC_PARAM_PROFILE_ID_TYPES['HIGH']: 'high',
+}
+_VIDEO_LEVEL_NAMES = {
+    VIDEO_CODEC_PARAM_LEVEL_TYPES['TYPE3_1']: '3.1',
+    VIDEO_CODEC_PARAM_LEVEL_TYPES['TYPE3_2']: '3.2',
+    VIDEO_CODEC_PARAM_LEVEL_TYPES['TYPE4_0']: '4.0',
+}
+_DEFAULT_VIDEO_PROFILE_NAME = 'baseline'
+_DEFAULT_VIDEO_LEVEL_NAME = '3.1'
+_SRTP_CRYPTO_PREFIX = tlv.encode(_SRTP_PARAM_CRYPTO, _SRTP_SUITE_AES_CM_128_HMAC_SHA1_80)
+
+# Audio codecs supported by iOS, mapped to their codec and bit rate types.
+_AUDIO_CODEC_MAP = {
+    'OPUS': (AUDIO_CODEC_TYPES['OPUS'], AUDIO_CODEC_PARAM_BIT_RATE_TYPES['VARIABLE']),
+    'AAC-eld': (AUDIO_CODEC_TYPES['AACELD'],
+                AUDIO_CODEC_PARAM_BIT_RATE_TYPES['VARIABLE']),
+}
+
+# Audio sample rates in kHz, mapped to their sample rate type.
+_AUDIO_SAMPLE_RATE_MAP = {
+    8: AUDIO_CODEC_PARAM_SAMPLE_RATE_TYPES['KHZ_8'],
+    16: AUDIO_CODEC_PARAM_SAMPLE_RATE_TYPES['KHZ_16'],
+    24: AUDIO_CODEC_PARAM_SAMPLE_RATE_TYPES['KHZ_24'],
+}
+
 NO_SRTP = b'\x01\x01\x02\x02\x00\x03\x00'
 '''Configuration value for no SRTP.'''
 
 
-FFMPEG_CMD = (
-    'ffmpeg -re -f avfoundation -framerate {fps} -i 0:0 -threads 0 '
-    '-vcodec libx264 -an -pix_fmt yuv420p -r {fps} -f rawvideo -tune zerolatency '
-    '-vf scale={width}:{height} -b:v {v_max_bitrate}k -bufsize {v_max_bitrate}k '
+_FFMPEG_INPUT = 'ffmpeg -re -f avfoundation -framerate {fps} -i 0:0 -threads 0 '
+
+_FFMPEG_OUTPUT = (
     '-payload_type 99 -ssrc {v_ssrc} -f rtp '
     '-srtp_out_suite AES_CM_128_HMAC_SHA1_80 -srtp_out_params {v_srtp_key} '
     'srtp://{address}:{v_port}?rtcpport={v_port}&'
     'localrtcpport={v_port}&pkt_size=1378'
 )
+
+FFMPEG_VIDEO_ENCODERS = {
+    'libx264': (
+        '-vcodec libx264 -an -pix_fmt yuv420p -r {fps} -f rawvideo -tune zerolatency '
+        '-vf scale={width}:{height} -b:v {v_max_bitrate}k -bufsize {v_max_bitrate}k '
+    ),
+    'h264_videotoolbox': (
+        '-vcodec h264_videotoolbox -an -pix_fmt yuv420p -r {fps} '
+        '-profile:v {v_profile_name} -level {v_level_name} '
+        '-vf scale={width}:{height} -b:v {v_max_bitrate}k '
+        '-maxrate {v_max_bitrate}k -bufsize {v_max_bitrate}k '
+    ),
+}
+'''ffmpeg video encoding arguments for each of the supported encoders.
+
+These are used with the avfoundation input of the default command, so they
+target macOS. The hardware encoder does not accept the libx264-only tuning
+flags and gets the H.264 profile and level negotiated with the client instead.
+'''
+
+FFMPEG_CMD = _FFMPEG_INPUT + FFMPEG_VIDEO_ENCODERS['libx264'] + _FFMPEG_OUTPUT
 '''Template for the ffmpeg command.'''
 
+_BOOL = struct.Struct('?')
+_U8 = struct.Struct('<B')
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_F32 = struct.Struct('<f')
+# Video attributes TLV with the 2-byte width, height and frame rate of a resolution.
+_RESOLUTION_ATTRIBUTES = struct.Struct('<cBcBHcBHcBH')
+
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value):
+    """Return a hashable representation of the given configuration value."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+class _FrozenConfig:
+    """Hashable wrapper of a configuration, compared by its frozen representation."""
+
+    __slots__ = ('config', '_key')
+
+    def __init__(self, config):
+        self.config = config
+        self._key = _freeze(config)
+        hash(self._key)
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __eq__(self, other):
+        return isinstance(other, _FrozenConfig) and self._key == other._key
+
+
+def _memoize_config(func):
+    """Cache the TLV built by ``func`` for the most recent distinct configurations.
+
+    Bridges usually create many cameras from the same options, so the supported
+    configuration blobs only need to be built once.
+    """
+    @functools.lru_cache(maxsize=32)
+    def cached(frozen_config):
+        return func(frozen_config.config)
+
+    @functools.wraps(func)
+    def wrapper(params):
+        try:
+            frozen_config = _FrozenConfig(params)
+        except TypeError:  # unhashable or unorderable values, do not cache
+            return func(params)
+        return cached(frozen_config)
+
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_stream_cmd(template):
+    """Split a stream command template into its arguments.
+
+    Returns a tuple of ``(argument, has_fields)`` pairs. Arguments without
+    replacement fields are already unescaped, so only the ones that refer to
+    the stream configuration need to be formatted when a stream starts.
+    """
+    formatter = string.Formatter()
+    args = []
+    for arg in template.split():
+        parsed = list(formatter.parse(arg))
+        if any(field is not None for _, field, _, _ in parsed):
+            args.append((arg, True))
+        else:
+            args.append((''.join(literal for literal, _, _, _ in parsed), False))
+    return tuple(args)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_default_snapshot():
+    """Return the bundled placeholder snapshot, reading it from disk only once."""
+    with open(os.path.join(RESOURCE_DIR, 'snapshot.jpg'), 'rb') as fp:
+        return fp.read()
+
+
 class Camera(Accessory):
     """An Accessory that can negotiated camera stream settings with iOS and start a
     stream.
@@ -233,6 +435,7 @@ class Camera(Accessory):
     category = CATEGORY_CAMERA
 
     @staticmethod
+    @functools.lru_cache(maxsize=2)
     def get_supported_rtp_config(support_srtp):
         """Return a tlv representation of the RTP configuration we support.
 
@@ -248,6 +451,7 @@ class Camera(Accessory):
         return tlv.encode(RTP_CONFIG_TYPES['CRYPTO'], crypto, to_base64=True)
 
     @staticmethod
+    @_memoize_config
     def get_supported_video_stream_config(video_params):
         """Return a tlv representation of the supported video stream configuration.
 
@@ -258,34 +462,32 @@ class Camera(Accessory):
         :param video_params: Supported video configurations
         :type video_params: dict
         """
-        codec_params_tlv = tlv.encode(
-            VIDEO_CODEC_PARAM_TYPES['PACKETIZATION_MODE'],
-            VIDEO_CODEC_PARAM_PACKETIZATION_MODE_TYPES['NON_INTERLEAVED'])
+        codec_params_tlv = [tlv.encode(_VIDEO_CODEC_PARAM_PACKETIZATION_MODE,
+                                       _PACKETIZATION_MODE_NON_INTERLEAVED)]
 
         codec_params = video_params['codec']
         for profile in codec_params['profiles']:
-            codec_params_tlv += \
-                tlv.encode(VIDEO_CODEC_PARAM_TYPES['PROFILE_ID'], profile)
+            codec_params_tlv.append(tlv.encode(_VIDEO_CODEC_PARAM_PROFILE_ID, profile))
 
         for level in codec_params['levels']:
-            codec_params_tlv += \
-                tlv.encode(VIDEO_CODEC_PARAM_TYPES['LEVEL'], level)
+            codec_params_tlv.append(tlv.encode(_VIDEO_CODEC_PARAM_LEVEL, level))
 
-        attr_tlv = b''
+        attr_tlv = []
         for resolution in video_params['resolutions']:
-            res_tlv = tlv.encode(
-                VIDEO_ATTRIBUTES_TYPES['IMAGE_WIDTH'], struct.pack('<H', resolution[0]),
-                VIDEO_ATTRIBUTES_TYPES['IMAGE_HEIGHT'], struct.pack('<H', resolution[1]),
-                VIDEO_ATTRIBUTES_TYPES['FRAME_RATE'], struct.pack('<H', resolution[2]))
-            attr_tlv += tlv.encode(VIDEO_TYPES['ATTRIBUTES'], res_tlv)
+            attr_tlv.append(_RESOLUTION_ATTRIBUTES.pack(
+                _VIDEO_ATTRIBUTES, 12,
+                _VIDEO_ATTR_IMAGE_WIDTH, 2, resolution[0],
+                _VIDEO_ATTR_IMAGE_HEIGHT, 2, resolution[1],
+                _VIDEO_ATTR_FRAME_RATE, 2, resolution[2]))
 
-        config_tlv = tlv.encode(VIDEO_TYPES['CODEC'], VIDEO_CODEC_TYPES['H264'],
-                                VIDEO_TYPES['CODEC_PARAM'], codec_params_tlv)
+        config_tlv = tlv.encode(_VIDEO_CODEC, _VIDEO_CODEC_H264,
+                                _VIDEO_CODEC_PARAM, b''.join(codec_params_tlv))
 
-        return tlv.encode(SUPPORTED_VIDEO_CONFIG_TAG, config_tlv + attr_tlv,
+        return tlv.encode(SUPPORTED_VIDEO_CONFIG_TAG, config_tlv + b''.join(attr_tlv),
                           to_base64=True)
 
     @staticmethod
+    @_memoize_config
     def get_supported_audio_stream_config(audio_params):
         """Return a tlv representation of the supported audio stream configuration.
 
@@ -298,41 +500,30 @@ class Camera(Accessory):
         :param audio_params: Supported audio configurations
         :type audio_params: dict
         """
-        has_supported_codec = False
-        configs = b''
+        configs = []
         for codec_param in audio_params['codecs']:
             param_type = codec_param['type']
-            if param_type == 'OPUS':
-                has_supported_codec = True
-                codec = AUDIO_CODEC_TYPES['OPUS']
-                bitrate = AUDIO_CODEC_PARAM_BIT_RATE_TYPES['VARIABLE']
-            elif param_type == 'AAC-eld':
-                has_supported_codec = True
-                codec = AUDIO_CODEC_TYPES['AACELD']
-                bitrate = AUDIO_CODEC_PARAM_BIT_RATE_TYPES['VARIABLE']
-            else:
+            codec_types = _AUDIO_CODEC_MAP.get(param_type)
+            if codec_types is None:
                 logger.warning('Unsupported codec %s', param_type)
                 continue
+            codec, bitrate = codec_types
 
             param_samplerate = codec_param['samplerate']
-            if param_samplerate == 8:
-                samplerate = AUDIO_CODEC_PARAM_SAMPLE_RATE_TYPES['KHZ_8']
-            elif param_samplerate == 16:
-                samplerate = AUDIO_CODEC_PARAM_SAMPLE_RATE_TYPES['KHZ_16']
-            elif param_samplerate == 24:
-                samplerate = AUDIO_CODEC_PARAM_SAMPLE_RATE_TYPES['KHZ_24']
-            else:
+            samplerate = _AUDIO_SAMPLE_RATE_MAP.get(param_samplerate)
+            if samplerate is None:
                 logger.warning('Unsupported sample rate %s', param_samplerate)
                 continue
 
-            param_tlv = tlv.encode(AUDIO_CODEC_PARAM_TYPES['CHANNEL'], b'\x01',
+            param_tlv = tlv.encode(AUDIO_CODEC_PARAM_TYPES['CHANNEL'],
+                                   _AUDIO_CHANNELS_MONO,
                                    AUDIO_CODEC_PARAM_TYPES['BIT_RATE'], bitrate,
                                    AUDIO_CODEC_PARAM_TYPES['SAMPLE_RATE'], samplerate)
             config_tlv = tlv.encode(AUDIO_TYPES['CODEC'], codec,
                                     AUDIO_TYPES['CODEC_PARAM'], param_tlv)
-            configs += tlv.encode(SUPPORTED_AUDIO_CODECS_TAG, config_tlv)
+            configs.append(tlv.encode(SUPPORTED_AUDIO_CODECS_TAG, config_tlv))
 
-        if not has_supported_codec:
+        if not configs:
             logger.warning('Client does not support any audio codec that iOS supports.')
 
             codec = AUDIO_CODEC_TYPES['OPUS']
@@ -340,19 +531,19 @@ class Camera(Accessory):
             samplerate = AUDIO_CODEC_PARAM_SAMPLE_RATE_TYPES['KHZ_24']
 
             param_tlv = tlv.encode(
-                AUDIO_CODEC_PARAM_TYPES['CHANNEL'], b'\x01',
+                AUDIO_CODEC_PARAM_TYPES['CHANNEL'], _AUDIO_CHANNELS_MONO,
                 AUDIO_CODEC_PARAM_TYPES['BIT_RATE'], bitrate,
                 AUDIO_CODEC_PARAM_TYPES['SAMPLE_RATE'], samplerate)
 
             config_tlv = tlv.encode(AUDIO_TYPES['CODEC'], codec,
                                     AUDIO_TYPES['CODEC_PARAM'], param_tlv)
 
-            configs = tlv.encode(SUPPORTED_AUDIO_CODECS_TAG, config_tlv)
+            configs.append(tlv.encode(SUPPORTED_AUDIO_CODECS_TAG, config_tlv))
 
         comfort_noise = byte_bool(
                             audio_params.get('comfort_noise', False))
-        audio_config = to_base64_str(
-                        configs + tlv.encode(SUPPORTED_COMFORT_NOISE_TAG, comfort_noise))
+        configs.append(tlv.encode(SUPPORTED_COMFORT_NOISE_TAG, comfort_noise))
+        audio_config = to_base64_str(b''.join(configs))
         return audio_config
 
     def __init__(self, options, *args, **kwargs):
@@ -400,24 +591,46 @@ class Camera(Accessory):
                 "address": "192.168.1.226",  # Address from which the camera will stream
             }
 
+            The address must be a literal IPv4 or IPv6 address, not a host name.
+
             Additional optional values are:
             - srtp - boolean, defaults to False. Whether the camera supports SRTP.
             - start_stream_cmd - string specifying the command to be executed to start
                 the stream. The string can contain the keywords, corresponding to the
                 video and audio configuration that was negotiated between the camera
                 and the client. See the ``start`` method for a full list of parameters.
+            - video_encoder - the ffmpeg video encoder used by the default start
+                stream command, one of ``FFMPEG_VIDEO_ENCODERS``. Defaults to
+                libx264. The default command captures the video with avfoundation,
+                so these encoders target macOS. Ignored if start_stream_cmd is given.
+            - start_audio_stream_cmd - string specifying a command that streams the
+                audio in its own process, next to the one started with
+                start_stream_cmd. It is formatted in the same way. No audio
+                process is started if it is not given.
 
         :type options: ``dict``
         """
         self.has_srtp = options.get('srtp', False)
-        self.start_stream_cmd = options.get('start_stream_cmd', FFMPEG_CMD)
+        video_encoder = options.get('video_encoder', 'libx264')
+        if video_encoder not in FFMPEG_VIDEO_ENCODERS:
+            raise ValueError(f'Unsupported video encoder {video_encoder}')
+        self.start_stream_cmd = options.get(
+            'start_stream_cmd',
+            _FFMPEG_INPUT + FFMPEG_VIDEO_ENCODERS[video_encoder] + _FFMPEG_OUTPUT)
+        self.start_audio_stream_cmd = options.get('start_audio_stream_cmd')
 
         self.stream_address = options['address']
-        try:
-            ipaddress.IPv4Address(self.stream_address)
-            self.stream_address_isv6 = b'\x00'
-        except ValueError:
-            self.stream_address_isv6 = b'\x01'
+        if __debug__:
+            # Raises ValueError for host names and malformed addresses.
+            ipaddress.ip_address(self.stream_address)
+        # IPv6 addresses always contain a colon, IPv4 addresses never do.
+        self.stream_address_isv6 = \
+            SETUP_IPV['IPV6'] if ':' in self.stream_address else SETUP_IPV['IPV4']
+        # The camera address never changes, so the address part of the
+        # SetupEndpoints response is encoded only once.
+        self._stream_address_tlv = tlv.encode(
+            SETUP_ADDR_INFO['ADDRESS_VER'], self.stream_address_isv6,
+            SETUP_ADDR_INFO['ADDRESS'], self.stream_address.encode('utf-8'))
         self.sessions = {}
 
         super().__init__(*args, **kwargs)
@@ -437,7 +650,7 @@ class Camera(Accessory):
         stream_count = options.get("stream_count", 1)
         for stream_idx in range(stream_count):
             self._management.append(self._create_stream_management(stream_idx, options))
-            self._streaming_status.append(STREAMING_STATUS["AVAILABLE"])
+            self._streaming_status.append(_STREAMING_STATUS_AVAILABLE)
 
     def _create_stream_management(self, stream_idx, options):
         """Create a stream management service."""
@@ -470,7 +683,8 @@ class Camera(Accessory):
         )
         return management
 
-    async def _start_stream(self, objs, reconfigure):  # pylint: disable=unused-argument
+    async def _start_stream(self, objs, session_objs,  # pylint: disable=unused-argument
+                            reconfigure):
         """Start or reconfigure video streaming for the given session.
 
         Schedules ``self.start_stream`` or ``self.reconfigure``.
@@ -480,86 +694,103 @@ class Camera(Accessory):
         :param objs: TLV-decoded SelectedRTPStreamConfiguration
         :type objs: ``dict``
 
+        :param session_objs: TLV-decoded session control of ``objs``.
+        :type session_objs: ``dict``
+
         :param reconfigure: Whether the stream should be reconfigured instead of
             started.
         :type reconfigure: bool
         """
-        video_tlv = objs.get(SELECTED_STREAM_CONFIGURATION_TYPES['VIDEO'])
-        audio_tlv = objs.get(SELECTED_STREAM_CONFIGURATION_TYPES['AUDIO'])
+        video_tlv = objs.get(_SELECTED_VIDEO)
+        audio_tlv = objs.get(_SELECTED_AUDIO)
 
         opts = {}
 
         if video_tlv:
             video_objs = tlv.decode(video_tlv)
 
-            video_codec_params = video_objs.get(VIDEO_TYPES['CODEC_PARAM'])
+            video_codec_params = video_objs.get(_VIDEO_CODEC_PARAM)
             if video_codec_params:
                 video_codec_param_objs = tlv.decode(video_codec_params)
                 opts['v_profile_id'] = \
-                    video_codec_param_objs[VIDEO_CODEC_PARAM_TYPES['PROFILE_ID']]
+                    video_codec_param_objs[_VIDEO_CODEC_PARAM_PROFILE_ID]
                 opts['v_level'] = \
-                    video_codec_param_objs[VIDEO_CODEC_PARAM_TYPES['LEVEL']]
+                    video_codec_param_objs[_VIDEO_CODEC_PARAM_LEVEL]
+                profile_name = _VIDEO_PROFILE_NAMES.get(opts['v_profile_id'])
+                if profile_name is None:
+                    profile_name = _DEFAULT_VIDEO_PROFILE_NAME
+                    logger.warning('Unsupported H.264 profile %s, using %s',
+                                   opts['v_profile_id'], profile_name)
+                level_name = _VIDEO_LEVEL_NAMES.get(opts['v_level'])
+                if level_name is None:
+                    level_name = _DEFAULT_VIDEO_LEVEL_NAME
+                    logger.warning('Unsupported H.264 level %s, using %s',
+                                   opts['v_level'], level_name)
+            else:
+                profile_name = _DEFAULT_VIDEO_PROFILE_NAME
+                level_name = _DEFAULT_VIDEO_LEVEL_NAME
+            opts['v_profile_name'] = profile_name
+            opts['v_level_name'] = level_name
 
-            video_attrs = video_objs.get(VIDEO_TYPES['ATTRIBUTES'])
+            video_attrs = video_objs.get(_VIDEO_ATTRIBUTES)
             if video_attrs:
                 video_attr_objs = tlv.decode(video_attrs)
-                opts['width'] = struct.unpack('<H',
-                            video_attr_objs[VIDEO_ATTRIBUTES_TYPES['IMAGE_WIDTH']])[0]
-                opts['height'] = struct.unpack('<H',
-                            video_attr_objs[VIDEO_ATTRIBUTES_TYPES['IMAGE_HEIGHT']])[0]
-                opts['fps'] = struct.unpack('<B',
-                                video_attr_objs[VIDEO_ATTRIBUTES_TYPES['FRAME_RATE']])[0]
-
-            video_rtp_param = video_objs.get(VIDEO_TYPES['RTP_PARAM'])
+                opts['width'] = _U16.unpack(
+                            video_attr_objs[_VIDEO_ATTR_IMAGE_WIDTH])[0]
+                opts['height'] = _U16.unpack(
+                            video_attr_objs[_VIDEO_ATTR_IMAGE_HEIGHT])[0]
+                opts['fps'] = _U8.unpack(
+                                video_attr_objs[_VIDEO_ATTR_FRAME_RATE])[0]
+
+            video_rtp_param = video_objs.get(_VIDEO_RTP_PARAM)
             if video_rtp_param:
                 video_rtp_param_objs = tlv.decode(video_rtp_param)
-                if RTP_PARAM_TYPES['SYNCHRONIZATION_SOURCE'] in video_rtp_param_objs:
-                    opts['v_ssrc'] = struct.unpack('<I',
+                if _RTP_PARAM_SYNCHRONIZATION_SOURCE in video_rtp_param_objs:
+                    opts['v_ssrc'] = _U32.unpack(
                         video_rtp_param_objs.get(
-                            RTP_PARAM_TYPES['SYNCHRONIZATION_SOURCE']))[0]
-                if RTP_PARAM_TYPES['PAYLOAD_TYPE'] in video_rtp_param_objs:
+                            _RTP_PARAM_SYNCHRONIZATION_SOURCE))[0]
+                if _RTP_PARAM_PAYLOAD_TYPE in video_rtp_param_objs:
                     opts['v_payload_type'] = \
-                        video_rtp_param_objs.get(RTP_PARAM_TYPES['PAYLOAD_TYPE'])
-                if RTP_PARAM_TYPES['MAX_BIT_RATE'] in video_rtp_param_objs:
-                    opts['v_max_bitrate'] = struct.unpack('<H',
-                        video_rtp_param_objs.get(RTP_PARAM_TYPES['MAX_BIT_RATE']))[0]
-                if RTP_PARAM_TYPES['RTCP_SEND_INTERVAL'] in video_rtp_param_objs:
-                    opts['v_rtcp_interval'] = struct.unpack('<f',
-                        video_rtp_param_objs.get(RTP_PARAM_TYPES['RTCP_SEND_INTERVAL']))[0]
-                if RTP_PARAM_TYPES['MAX_MTU'] in video_rtp_param_objs:
-                    opts['v_max_mtu'] = video_rtp_param_objs.get(RTP_PARAM_TYPES['MAX_MTU'])
+                        video_rtp_param_objs.get(_RTP_PARAM_PAYLOAD_TYPE)
+                if _RTP_PARAM_MAX_BIT_RATE in video_rtp_param_objs:
+                    opts['v_max_bitrate'] = _U16.unpack(
+                        video_rtp_param_objs.get(_RTP_PARAM_MAX_BIT_RATE))[0]
+                if _RTP_PARAM_RTCP_SEND_INTERVAL in video_rtp_param_objs:
+                    opts['v_rtcp_interval'] = _F32.unpack(
+                        video_rtp_param_objs.get(_RTP_PARAM_RTCP_SEND_INTERVAL))[0]
+                if _RTP_PARAM_MAX_MTU in video_rtp_param_objs:
+                    opts['v_max_mtu'] = video_rtp_param_objs.get(_RTP_PARAM_MAX_MTU)
 
         if audio_tlv:
             audio_objs = tlv.decode(audio_tlv)
 
-            opts['a_codec'] = audio_objs[AUDIO_TYPES['CODEC']]
+            opts['a_codec'] = audio_objs[_AUDIO_CODEC]
             audio_codec_param_objs = tlv.decode(
-                                        audio_objs[AUDIO_TYPES['CODEC_PARAM']])
+                                        audio_objs[_AUDIO_CODEC_PARAM])
             audio_rtp_param_objs = tlv.decode(
-                                        audio_objs[AUDIO_TYPES['RTP_PARAM']])
-            opts['a_comfort_noise'] = audio_objs[AUDIO_TYPES['COMFORT_NOISE']]
+                                        audio_objs[_AUDIO_RTP_PARAM])
+            opts['a_comfort_noise'] = audio_objs[_AUDIO_COMFORT_NOISE]
 
             opts['a_channel'] = \
-                audio_codec_param_objs[AUDIO_CODEC_PARAM_TYPES['CHANNEL']][0]
-            opts['a_bitrate'] = struct.unpack('?',
-                audio_codec_param_objs[AUDIO_CODEC_PARAM_TYPES['BIT_RATE']])[0]
+                audio_codec_param_objs[_AUDIO_CODEC_PARAM_CHANNEL][0]
+            opts['a_bitrate'] = _BOOL.unpack(
+                audio_codec_param_objs[_AUDIO_CODEC_PARAM_BIT_RATE])[0]
             opts['a_sample_rate'] = 8 * (
-                1 + audio_codec_param_objs[AUDIO_CODEC_PARAM_TYPES['SAMPLE_RATE']][0])
-            opts['a_packet_time'] = struct.unpack('<B',
-                audio_codec_param_objs[AUDIO_CODEC_PARAM_TYPES['PACKET_TIME']])[0]
-
-            opts['a_ssrc'] = struct.unpack('<I',
-                audio_rtp_param_objs[RTP_PARAM_TYPES['SYNCHRONIZATION_SOURCE']])[0]
-            opts['a_payload_type'] = audio_rtp_param_objs[RTP_PARAM_TYPES['PAYLOAD_TYPE']]
-            opts['a_max_bitrate'] = struct.unpack('<H',
-                audio_rtp_param_objs[RTP_PARAM_TYPES['MAX_BIT_RATE']])[0]
-            opts['a_rtcp_interval'] = struct.unpack('<f',
-                audio_rtp_param_objs[RTP_PARAM_TYPES['RTCP_SEND_INTERVAL']])[0]
+                1 + audio_codec_param_objs[_AUDIO_CODEC_PARAM_SAMPLE_RATE][0])
+            opts['a_packet_time'] = _U8.unpack(
+                audio_codec_param_objs[_AUDIO_CODEC_PARAM_PACKET_TIME])[0]
+
+            opts['a_ssrc'] = _U32.unpack(
+                audio_rtp_param_objs[_RTP_PARAM_SYNCHRONIZATION_SOURCE])[0]
+            opts['a_payload_type'] = audio_rtp_param_objs[_RTP_PARAM_PAYLOAD_TYPE]
+            opts['a_max_bitrate'] = _U16.unpack(
+                audio_rtp_param_objs[_RTP_PARAM_MAX_BIT_RATE])[0]
+            opts['a_rtcp_interval'] = _F32.unpack(
+                audio_rtp_param_objs[_RTP_PARAM_RTCP_SEND_INTERVAL])[0]
             opts['a_comfort_payload_type'] = \
-                audio_rtp_param_objs[RTP_PARAM_TYPES['COMFORT_NOISE_PAYLOAD_TYPE']]
+                audio_rtp_param_objs[_RTP_PARAM_COMFORT_NOISE_PAYLOAD_TYPE]
 
-        session_objs = tlv.decode(objs[SELECTED_STREAM_CONFIGURATION_TYPES['SESSION']])
-        session_id = UUID(bytes=session_objs[SETUP_TYPES['SESSION_ID']])
+        session_id = UUID(bytes=session_objs[_SETUP_SESSION_ID])
         session_info = self.sessions[session_id]
         stream_idx = session_info['stream_idx']
 
@@ -568,32 +799,35 @@ class Camera(Accessory):
             else await self.start_stream(session_info, opts)
 
         if success:
-            self._streaming_status[stream_idx] = STREAMING_STATUS['STREAMING']
+            self._streaming_status[stream_idx] = _STREAMING_STATUS_STREAMING
         else:
             logger.error(
                 '[%s] Failed to start/reconfigure stream, deleting session.',
                 session_id
             )
             del self.sessions[session_id]
-            self._streaming_status[stream_idx] = STREAMING_STATUS['AVAILABLE']
+            self._streaming_status[stream_idx] = _STREAMING_STATUS_AVAILABLE
 
     def _get_streaming_status(self, stream_idx):
         """Get the streaming status in TLV format.
 
         Called when iOS reads the StreaminStatus ``Characteristic``.
         """
-        return tlv.encode(b'\x01', self._streaming_status[stream_idx], to_base64=True)
+        return tlv.encode(_STREAMING_STATUS_TAG, self._streaming_status[stream_idx],
+                          to_base64=True)
 
-    async def _stop_stream(self, objs):
+    async def _stop_stream(self, objs, session_objs):  # pylint: disable=unused-argument
         """Stop the stream for the specified session.
 
         Schedules ``self.stop_stream``.
 
         :param objs: TLV-decoded SelectedRTPStreamConfiguration value.
         :param objs: ``dict``
+
+        :param session_objs: TLV-decoded session control of ``objs``.
+        :type session_objs: ``dict``
         """
-        session_objs = tlv.decode(objs[SELECTED_STREAM_CONFIGURATION_TYPES['SESSION']])
-        session_id = UUID(bytes=session_objs[SETUP_TYPES['SESSION_ID']])
+        session_id = UUID(bytes=session_objs[_SETUP_SESSION_ID])
 
         session_info = self.sessions.get(session_id)
         if not session_info:
@@ -608,7 +842,7 @@ class Camera(Accessory):
         await self.stop_stream(session_info)
         del self.sessions[session_id]
 
-        self._streaming_status[stream_idx] = STREAMING_STATUS['AVAILABLE']
+        self._streaming_status[stream_idx] = _STREAMING_STATUS_AVAILABLE
 
     def set_selected_stream_configuration(self, value):
         """Set the selected stream configuration.
@@ -624,13 +858,13 @@ class Camera(Accessory):
         logger.debug('set_selected_stream_config - value - %s', value)
 
         objs = tlv.decode(value, from_base64=True)
-        if SELECTED_STREAM_CONFIGURATION_TYPES['SESSION'] not in objs:
+        if _SELECTED_SESSION not in objs:
             logger.error('Bad request to set selected stream configuration.')
             return
 
-        session = tlv.decode(objs[SELECTED_STREAM_CONFIGURATION_TYPES['SESSION']])
+        session = tlv.decode(objs[_SELECTED_SESSION])
 
-        request_type = session[b'\x02'][0]
+        request_type = session[_SESSION_COMMAND][0]
         logger.debug('Set stream config request: %d', request_type)
         if request_type == 1:
             job = functools.partial(self._start_stream, reconfigure=False)
@@ -642,11 +876,11 @@ class Camera(Accessory):
             logger.error('Unknown request type %d', request_type)
             return
 
-        self.driver.add_job(job, objs)
+        self.driver.add_job(job, objs, session)
 
     def set_streaming_available(self, stream_idx):
         """Send an update to the controller that streaming is available."""
-        self._streaming_status[stream_idx] = STREAMING_STATUS["AVAILABLE"]
+        self._streaming_status[stream_idx] = _STREAMING_STATUS_AVAILABLE
         self._management[stream_idx].get_characteristic("StreamingStatus").notify()
 
     def set_endpoints(self, value, stream_idx=None):
@@ -662,32 +896,35 @@ class Camera(Accessory):
             stream_idx = 0
 
         objs = tlv.decode(value, from_base64=True)
-        session_id = UUID(bytes=objs[SETUP_TYPES['SESSION_ID']])
+        session_id = UUID(bytes=objs[_SETUP_SESSION_ID])
 
         # Extract address info
-        address_tlv = objs[SETUP_TYPES['ADDRESS']]
+        address_tlv = objs[_SETUP_ADDRESS]
         address_info_objs = tlv.decode(address_tlv)
-        is_ipv6 = struct.unpack('?',
-            address_info_objs[SETUP_ADDR_INFO['ADDRESS_VER']])[0]
-        address = address_info_objs[SETUP_ADDR_INFO['ADDRESS']].decode('utf8')
-        target_video_port = struct.unpack(
-            '<H', address_info_objs[SETUP_ADDR_INFO['VIDEO_RTP_PORT']])[0]
-        target_audio_port = struct.unpack(
-            '<H', address_info_objs[SETUP_ADDR_INFO['AUDIO_RTP_PORT']])[0]
+        is_ipv6 = _BOOL.unpack(
+            address_info_objs[_ADDR_INFO_ADDRESS_VER])[0]
+        address = address_info_objs[_ADDR_INFO_ADDRESS].decode('utf8')
+        target_video_port = _U16.unpack(
+            address_info_objs[_ADDR_INFO_VIDEO_RTP_PORT])[0]
+        target_audio_port = _U16.unpack(
+            address_info_objs[_ADDR_INFO_AUDIO_RTP_PORT])[0]
 
         # Video SRTP Params
-        video_srtp_tlv = objs[SETUP_TYPES['VIDEO_SRTP_PARAM']]
+        video_srtp_tlv = objs[_SETUP_VIDEO_SRTP_PARAM]
         video_info_objs = tlv.decode(video_srtp_tlv)
-        video_crypto_suite = video_info_objs[SETUP_SRTP_PARAM['CRYPTO']][0]
-        video_master_key = video_info_objs[SETUP_SRTP_PARAM['MASTER_KEY']]
-        video_master_salt = video_info_objs[SETUP_SRTP_PARAM['MASTER_SALT']]
+        video_crypto_suite = video_info_objs[_SRTP_PARAM_CRYPTO][0]
+        video_master_key = video_info_objs[_SRTP_PARAM_MASTER_KEY]
+        video_master_salt = video_info_objs[_SRTP_PARAM_MASTER_SALT]
 
         # Audio SRTP Params
-        audio_srtp_tlv = objs[SETUP_TYPES['AUDIO_SRTP_PARAM']]
+        audio_srtp_tlv = objs[_SETUP_AUDIO_SRTP_PARAM]
         audio_info_objs = tlv.decode(audio_srtp_tlv)
-        audio_crypto_suite = audio_info_objs[SETUP_SRTP_PARAM['CRYPTO']][0]
-        audio_master_key = audio_info_objs[SETUP_SRTP_PARAM['MASTER_KEY']]
-        audio_master_salt = audio_info_objs[SETUP_SRTP_PARAM['MASTER_SALT']]
+        audio_crypto_suite = audio_info_objs[_SRTP_PARAM_CRYPTO][0]
+        audio_master_key = audio_info_objs[_SRTP_PARAM_MASTER_KEY]
+        audio_master_salt = audio_info_objs[_SRTP_PARAM_MASTER_SALT]
+
+        video_srtp_key = b64encode(video_master_key + video_master_salt).decode('ascii')
+        audio_srtp_key = b64encode(audio_master_key + audio_master_salt).decode('ascii')
 
         logger.debug(
             'Received endpoint configuration:'
@@ -696,56 +933,50 @@ class Camera(Accessory):
             '\nvideo_crypto_suite: %s\nvideo_srtp: %s'
             '\naudio_crypto_suite: %s\naudio_srtp: %s',
             session_id, address, is_ipv6, target_video_port, target_audio_port,
-            video_crypto_suite,
-            to_base64_str(video_master_key + video_master_salt),
-            audio_crypto_suite,
-            to_base64_str(audio_master_key + audio_master_salt)
+            video_crypto_suite, video_srtp_key, audio_crypto_suite, audio_srtp_key
         )
 
         # Configure the SetupEndpoints response
 
         if self.has_srtp:
-            video_srtp_tlv = tlv.encode(
-                SETUP_SRTP_PARAM['CRYPTO'], SRTP_CRYPTO_SUITES['AES_CM_128_HMAC_SHA1_80'],
-                SETUP_SRTP_PARAM['MASTER_KEY'], video_master_key,
-                SETUP_SRTP_PARAM['MASTER_SALT'], video_master_salt)
-
-            audio_srtp_tlv = tlv.encode(
-                SETUP_SRTP_PARAM['CRYPTO'], SRTP_CRYPTO_SUITES['AES_CM_128_HMAC_SHA1_80'],
-                SETUP_SRTP_PARAM['MASTER_KEY'], audio_master_key,
-                SETUP_SRTP_PARAM['MASTER_SALT'], audio_master_salt)
+            video_srtp_tlv = _SRTP_CRYPTO_PREFIX + tlv.encode(
+                _SRTP_PARAM_MASTER_KEY, video_master_key,
+                _SRTP_PARAM_MASTER_SALT, video_master_salt)
+
+            audio_srtp_tlv = _SRTP_CRYPTO_PREFIX + tlv.encode(
+                _SRTP_PARAM_MASTER_KEY, audio_master_key,
+                _SRTP_PARAM_MASTER_SALT, audio_master_salt)
         else:
             video_srtp_tlv = NO_SRTP
             audio_srtp_tlv = NO_SRTP
 
-        video_ssrc = int.from_bytes(os.urandom(3), byteorder="big")
-        audio_ssrc = int.from_bytes(os.urandom(3), byteorder="big")
+        ssrc_bytes = os.urandom(6)
+        video_ssrc = int.from_bytes(ssrc_bytes[:3], byteorder="big")
+        audio_ssrc = int.from_bytes(ssrc_bytes[3:], byteorder="big")
 
-        res_address_tlv = tlv.encode(
-            SETUP_ADDR_INFO['ADDRESS_VER'], self.stream_address_isv6,
-            SETUP_ADDR_INFO['ADDRESS'], self.stream_address.encode('utf-8'),
-            SETUP_ADDR_INFO['VIDEO_RTP_PORT'], struct.pack('<H', target_video_port),
-            SETUP_ADDR_INFO['AUDIO_RTP_PORT'], struct.pack('<H', target_audio_port))
-
-        response_tlv = tlv.encode(
-            SETUP_TYPES['SESSION_ID'], session_id.bytes,
-            SETUP_TYPES['STATUS'], SETUP_STATUS['SUCCESS'],
-            SETUP_TYPES['ADDRESS'], res_address_tlv,
-            SETUP_TYPES['VIDEO_SRTP_PARAM'], video_srtp_tlv,
-            SETUP_TYPES['AUDIO_SRTP_PARAM'], audio_srtp_tlv,
-            SETUP_TYPES['VIDEO_SSRC'], struct.pack('<I', video_ssrc),
-            SETUP_TYPES['AUDIO_SSRC'], struct.pack('<I', audio_ssrc),
-            to_base64=True)
+        res_address_tlv = self._stream_address_tlv + tlv.encode(
+            _ADDR_INFO_VIDEO_RTP_PORT, _U16.pack(target_video_port),
+            _ADDR_INFO_AUDIO_RTP_PORT, _U16.pack(target_audio_port))
+
+        response_tlv = to_base64_str(
+            tlv.encode(_SETUP_SESSION_ID, session_id.bytes)
+            + _SETUP_STATUS_SUCCESS_TLV
+            + tlv.encode(
+                _SETUP_ADDRESS, res_address_tlv,
+                _SETUP_VIDEO_SRTP_PARAM, video_srtp_tlv,
+                _SETUP_AUDIO_SRTP_PARAM, audio_srtp_tlv,
+                _SETUP_VIDEO_SSRC, _U32.pack(video_ssrc),
+                _SETUP_AUDIO_SSRC, _U32.pack(audio_ssrc)))
 
         self.sessions[session_id] = {
             'id': session_id,
             'stream_idx': stream_idx,
             'address': address,
             'v_port': target_video_port,
-            'v_srtp_key': to_base64_str(video_master_key + video_master_salt),
+            'v_srtp_key': video_srtp_key,
             'v_ssrc': video_ssrc,
             'a_port': target_audio_port,
-            'a_srtp_key': to_base64_str(audio_master_key + audio_master_salt),
+            'a_srtp_key': audio_srtp_key,
             'a_ssrc': audio_ssrc
         }
 
@@ -767,7 +998,9 @@ class Camera(Accessory):
         needs to be stopped.
 
         The default implementation starts a new process with the command in
-        ``self.start_stream_cmd``, formatted with the ``stream_config``.
+        ``self.start_stream_cmd``, formatted with the ``stream_config``. If
+        ``self.start_audio_stream_cmd`` is set, the audio is streamed by a second
+        process started with that command.
 
         :param session_info: Contains information about the current session. Can be used
             for session storage. Available keys:
@@ -788,6 +1021,8 @@ class Camera(Accessory):
                     Refer to ``VIDEO_CODEC_PARAM_PROFILE_ID_TYPES``.
                 - v_level - The level in the profile ID, e.g. 3:1.
                     Refer to ``VIDEO_CODEC_PARAM_LEVEL_TYPES``.
+                - v_profile_name - The ffmpeg name of the profile, e.g. baseline.
+                - v_level_name - The ffmpeg name of the level, e.g. 3.1.
                 - width - Video width
                 - height - Video height
                 - fps - Video frame rate
@@ -821,33 +1056,67 @@ class Camera(Accessory):
             stream_config
         )
 
-        cmd = self.start_stream_cmd.format(**stream_config).split()
-        logger.debug('Executing start stream command: "%s"', ' '.join(cmd))
+        process = await self._start_stream_process(
+            session_info['id'], self.start_stream_cmd, stream_config)
+        if process is None:
+            return False
+
+        session_info['process'] = process
+
+        if self.start_audio_stream_cmd:
+            audio_process = await self._start_stream_process(
+                session_info['id'], self.start_audio_stream_cmd, stream_config)
+            if audio_process is None:
+                await self._stop_stream_process(process)
+                return False
+
+            session_info['audio_process'] = audio_process
+
+        return True
+
+    async def _start_stream_process(self, session_id, stream_cmd, stream_config):
+        """Start a process executing ``stream_cmd`` formatted with ``stream_config``.
+
+        :return: The started process or None if it could not be started.
+        :rtype: ``asyncio.subprocess.Process``
+        """
+        try:
+            cmd = [
+                arg.format(**stream_config) if has_fields else arg
+                for arg, has_fields in _parse_stream_cmd(stream_cmd)
+            ]
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(
+                '[%s] Failed to format stream command %r, missing or invalid '
+                'parameter: %s', session_id, stream_cmd, e)
+            return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Executing start stream command: "%s"', ' '.join(cmd))
         try:
             process = await asyncio.create_subprocess_exec(*cmd,
+                    stdin=asyncio.subprocess.DEVNULL,
                     stdout=asyncio.subprocess.DEVNULL,
                     stderr=asyncio.subprocess.PIPE,
                     limit=1024)
         except Exception as e:  # pylint: disable=broad-except
             logger.error('Failed to start streaming process because of error: %s', e)
-            return False
-
-        session_info['process'] = process
+            return None
 
         logger.info(
             '[%s] Started stream process - PID %d',
-            session_info['id'],
+            session_id,
             process.pid
         )
 
-        return True
+        return process
 
     async def stop_stream(self, session_info):
         """Stop the stream for the given ``session_id``.
 
         This method can be implemented if custom stop stream commands are needed. The
         default implementation gets the ``process`` value from the ``session_info``
-        object and terminates it (assumes it is a ``subprocess.Popen`` object).
+        object and terminates it (assumes it is a ``subprocess.Popen`` object), along
+        with the ``audio_process``, if any.
 
         :param session_info: The session info object. Available keys:
             - id - The session ID.
@@ -857,22 +1126,32 @@ class Camera(Accessory):
         ffmpeg_process = session_info.get('process')
         if ffmpeg_process:
             logger.info('[%s] Stopping stream.', session_id)
-            try:
-                ffmpeg_process.terminate()
-                async with async_timeout.timeout(2.0):
-                    _, stderr = await ffmpeg_process.communicate()
-                logger.debug('Stream command stderr: %s', stderr)
-            except asyncio.TimeoutError:
-                logger.error(
-                    'Timeout while waiting for the stream process '
-                    'to terminate. Trying with kill.'
-                )
-                ffmpeg_process.kill()
-                await ffmpeg_process.wait()
-            logger.debug('Stream process stopped.')
+            audio_process = session_info.get('audio_process')
+            if audio_process:
+                await asyncio.gather(self._stop_stream_process(ffmpeg_process),
+                                     self._stop_stream_process(audio_process))
+            else:
+                await self._stop_stream_process(ffmpeg_process)
         else:
             logger.warning('No process for session ID %s', session_id)
 
+    @staticmethod
+    async def _stop_stream_process(process):
+        """Terminate the given stream process, killing it if it does not exit."""
+        try:
+            process.terminate()
+            async with async_timeout.timeout(2.0):
+                _, stderr = await process.communicate()
+            logger.debug('Stream command stderr: %s', stderr)
+        except asyncio.TimeoutError:
+            logger.error(
+                'Timeout while waiting for the stream process '
+                'to terminate. Trying with kill.'
+            )
+            process.kill()
+            await process.wait()
+        logger.debug('Stream process stopped.')
+
     async def reconfigure_stream(self, session_info, stream_config):
         """Reconfigure the stream so that it uses the given ``stream_config``.
 
@@ -894,5 +1173,4 @@ class Camera(Accessory):
         :param image_size: ``dict`` describing the requested image size. Contains the
             keys "image-width" and "image-height"
         """
-        with open(os.path.join(RESOURCE_DIR, 'snapshot.jpg'), 'rb') as fp:
-            return fp.read()
+        return _read_default_snapshot()
@@ -56,14 +56,16 @@ HAP_FORMAT_DEFAULTS = {
     HAP_FORMAT_TLV8: "",
 }
 
-HAP_FORMAT_NUMERICS = {
-    HAP_FORMAT_INT,
-    HAP_FORMAT_FLOAT,
-    HAP_FORMAT_UINT8,
-    HAP_FORMAT_UINT16,
-    HAP_FORMAT_UINT32,
-    HAP_FORMAT_UINT64,
-}
+HAP_FORMAT_NUMERICS = frozenset(
+    {
+        HAP_FORMAT_INT,
+        HAP_FORMAT_FLOAT,
+        HAP_FORMAT_UINT8,
+        HAP_FORMAT_UINT16,
+        HAP_FORMAT_UINT32,
+        HAP_FORMAT_UINT64,
+    }
+)
 
 DEFAULT_MAX_LENGTH = 64
 ABSOLUTE_MAX_LENGTH = 256
@@ -84,7 +86,9 @@ PROP_PERMISSIONS = "Permissions"
 PROP_UNIT = "unit"
 PROP_VALID_VALUES = "ValidValues"
 
-PROP_NUMERIC = {PROP_MAX_VALUE, PROP_MIN_VALUE, PROP_MIN_STEP, PROP_UNIT}
+PROP_NUMERIC = frozenset({PROP_MAX_VALUE, PROP_MIN_VALUE, PROP_MIN_STEP, PROP_UNIT})
+# PROP_NUMERIC in a fixed order, so the HAP representation is stable.
+_PROP_NUMERIC_ORDERED = (PROP_MAX_VALUE, PROP_MIN_VALUE, PROP_MIN_STEP, PROP_UNIT)
 
 CHAR_BUTTON_EVENT = UUID("00000126-0000-1000-8000-0026BB765291")
 CHAR_PROGRAMMABLE_SWITCH_EVENT = UUID("00000073-0000-1000-8000-0026BB765291")
@@ -139,6 +143,11 @@ class Characteristic:
         "_to_hap_cache_with_value",
         "_to_hap_cache",
         "_always_null",
+        "_immediate_notify",
+        "_validate",
+        "_properties_snapshot",
+        "_valid_values",
+        "_validated_value",
     )
 
     def __init__(
@@ -173,9 +182,11 @@ class Characteristic:
         # depending on the device.
         #
         self._always_null = type_id in ALWAYS_NULL
+        self._immediate_notify = type_id in IMMEDIATE_NOTIFY
         self.allow_invalid_client_values = allow_invalid_client_values
         self._display_name = display_name
         self._properties: Dict[str, Any] = properties
+        self._refresh_properties()
         self.type_id = type_id
         self._value = self._get_default_value()
         self.getter_callback: Optional[Callable[[], Any]] = None
@@ -207,13 +218,17 @@ class Characteristic:
     def value(self, value: Any) -> None:
         """Set the value of the characteristic."""
         self._value = value
-        self._clear_cache()
+        # Only the value changed, the cached representation without it is still valid.
+        self._to_hap_cache_with_value = None
 
     @property
     def properties(self) -> Dict[str, Any]:
         """Return the properties of the characteristic.
 
-        Properties should not be modified directly. Use override_properties instead.
+        Properties should not be modified directly. Use override_properties instead,
+        it is the only supported way to change them. Changes made in place are
+        still detected before the next value is validated, but only by comparing
+        the properties with a copy taken when they were last applied.
         """
         return self._properties
 
@@ -229,12 +244,11 @@ class Characteristic:
         if self._always_null:
             return None
 
-        valid_values = self._properties.get(PROP_VALID_VALUES)
-        if valid_values:
-            return min(valid_values.values())
+        if self._valid_values is not None:
+            return min(self._valid_values)
 
         value = HAP_FORMAT_DEFAULTS[self._properties[PROP_FORMAT]]
-        return self.to_valid_value(value)
+        return self._validate(value)
 
     def get_value(self) -> Any:
         """This is to allow for calling `getter_callback`
@@ -250,10 +264,10 @@ class Characteristic:
         """Raise ValueError if PROP_VALID_VALUES is set and the value is not present."""
         if self._always_null:
             return
-        valid_values = self._properties.get(PROP_VALID_VALUES)
-        if not valid_values:
-            return
-        if value in valid_values.values():
+        if self._properties != self._properties_snapshot:
+            self._refresh_properties()
+        valid_values = self._valid_values
+        if valid_values is None or value in valid_values:
             return
         error_msg = f"{self._display_name}: value={value} is an invalid value."
         logger.error(error_msg)
@@ -261,31 +275,60 @@ class Characteristic:
 
     def to_valid_value(self, value: Any) -> Any:
         """Perform validation and conversion to valid value."""
+        if self._properties != self._properties_snapshot:
+            self._refresh_properties()
+        return self._validate(value)
+
+    def _make_validator(self) -> Callable[[Any], Any]:
+        """Return a function converting values to valid values for the properties.
+
+        The properties are only inspected once, so the returned function
+        does not have to look them up again for every value.
+        """
         properties = self._properties
         prop_format = properties[PROP_FORMAT]
 
         if prop_format == HAP_FORMAT_STRING:
-            return str(value)[: properties.get(HAP_REPR_MAX_LEN, DEFAULT_MAX_LENGTH)]
+            max_length = properties.get(HAP_REPR_MAX_LEN, DEFAULT_MAX_LENGTH)
+            return lambda value: str(value)[:max_length]
 
         if prop_format == HAP_FORMAT_BOOL:
-            return bool(value)
-
-        if prop_format in HAP_FORMAT_NUMERICS:
+            return bool
+
+        if prop_format not in HAP_FORMAT_NUMERICS:
+            return lambda value: value
+
+        min_step = properties.get(PROP_MIN_STEP)
+        max_value = properties.get(PROP_MAX_VALUE)
+        min_value = properties.get(PROP_MIN_VALUE)
+        is_float = prop_format == HAP_FORMAT_FLOAT
+        # Steps are counted from minValue, so that values stay on the same grid
+        # as the adjusted maxValue.
+        step_origin = min_value or 0
+        if min_step and max_value is not None and min_value is not None:
+            # HomeKit rejects values above the last step reachable from minValue.
+            steps = int(round((max_value - min_value) / min_step, 10))
+            max_value = min(max_value, round(min_step * steps, 14) + min_value)
+
+        def to_valid_numeric(value: Any) -> Any:
             if not isinstance(value, (int, float)):
                 error_msg = (
                     f"{self._display_name}: value={value} is not a numeric value."
                 )
                 logger.error(error_msg)
                 raise ValueError(error_msg)
-            min_step = properties.get(PROP_MIN_STEP)
-            if value and min_step:
-                value = round(min_step * round(value / min_step), 14)
-            value = min(properties.get(PROP_MAX_VALUE, value), value)
-            value = max(properties.get(PROP_MIN_VALUE, value), value)
-            if prop_format != HAP_FORMAT_FLOAT:
-                return int(value)
-
-        return value
+            if value != step_origin and min_step:
+                steps = round((value - step_origin) / min_step)
+                value = round(min_step * steps, 14) + step_origin
+            # Same results as min(max_value, value) and max(min_value, value),
+            # including for NaN, without the calls.
+            if max_value is not None and not value < max_value:
+                value = max_value
+            if min_value is not None and not value > min_value:
+                value = min_value
+            return value if is_float else int(value)
+
+        return to_valid_numeric
 
     def override_properties(
         self,
@@ -314,6 +357,8 @@ class Characteristic:
         if valid_values:
             self._properties[PROP_VALID_VALUES] = valid_values
 
+        self._refresh_properties()
+
         if self._always_null:
             self.value = None
             return
@@ -324,6 +369,24 @@ class Characteristic:
         except ValueError:
             self.value = self._get_default_value()
 
+    def _refresh_properties(self) -> None:
+        """Update the state derived from the properties after they changed.
+
+        The snapshot lets the value paths detect properties that were modified
+        in place with a single dict comparison.
+        """
+        properties = self._properties
+        valid_values = properties.get(PROP_VALID_VALUES)
+        snapshot = dict(properties)
+        if valid_values:
+            # Copied as well, so that valid values edited in place are detected.
+            snapshot[PROP_VALID_VALUES] = dict(valid_values)
+        self._properties_snapshot = snapshot
+        self._valid_values = frozenset(valid_values.values()) if valid_values else None
+        self._validate = self._make_validator()
+        # Values validated against the previous properties may no longer be valid.
+        self._validated_value = None
+
     def _clear_cache(self) -> None:
         """Clear the cached HAP representation."""
         self._to_hap_cache = None
@@ -349,10 +412,24 @@ class Characteristic:
         :type should_notify: bool
         """
         logger.debug("set_value: %s to %s", self._display_name, value)
-        value = self.to_valid_value(value)
+        if self._properties != self._properties_snapshot:
+            self._refresh_properties()
+        current_value = self._value
+        if (
+            current_value is not None
+            and current_value is self._validated_value
+            and value.__class__ is current_value.__class__
+            and value == current_value
+        ):
+            # The current value was validated by a previous call, so validating
+            # an equal value of the same type would return it unchanged and
+            # there is nothing to notify.
+            return
+        value = self._validate(value)
         self.valid_value_or_raise(value)
         changed = self._value != value
         self.value = value
+        self._validated_value = value
         if changed and should_notify and self.broker:
             self.notify()
         if self._always_null:
@@ -366,8 +443,10 @@ class Characteristic:
         Change self.value to value and call callback.
         """
         original_value = value
+        if self._properties != self._properties_snapshot:
+            self._refresh_properties()
         if not self._always_null or original_value is not None:
-            value = self.to_valid_value(value)
+            value = self._validate(value)
         if not self.allow_invalid_client_values:
             self.valid_value_or_raise(value)
         logger.debug(
@@ -396,8 +475,9 @@ class Characteristic:
         .. seealso:: accessory.publish
         .. seealso:: accessory_driver.publish
         """
-        immediate = self.type_id in IMMEDIATE_NOTIFY
-        self.broker.publish(self.value, self, sender_client_addr, immediate)
+        self.broker.publish(
+            self._value, self, sender_client_addr, self._immediate_notify
+        )
 
     # pylint: disable=invalid-name
     def to_HAP(self, include_value: bool = True) -> Dict[str, Any]:
@@ -408,19 +488,36 @@ class Characteristic:
         :return: A HAP representation.
         :rtype: dict
         """
-        if include_value:
-            if self._to_hap_cache_with_value is not None and not self.getter_callback:
-                return self._to_hap_cache_with_value
-        elif self._to_hap_cache is not None:
-            return self._to_hap_cache
+        if (
+            include_value
+            and self._to_hap_cache_with_value is not None
+            and not self.getter_callback
+        ):
+            return self._to_hap_cache_with_value
+
+        hap_rep = self._to_hap_cache
+        if hap_rep is None:
+            hap_rep = self._to_hap_cache = self._to_hap_without_value()
+        if not include_value:
+            return hap_rep
 
+        hap_rep = hap_rep.copy()
+        if HAP_PERMISSION_READ in self._properties[PROP_PERMISSIONS]:
+            hap_rep[HAP_REPR_VALUE] = self.get_value()
+
+        if not self.getter_callback:
+            # Only cache if there is no getter_callback
+            self._to_hap_cache_with_value = hap_rep
+        return hap_rep
+
+    def _to_hap_without_value(self) -> Dict[str, Any]:
+        """Create the HAP representation of this Characteristic without its value."""
         properties = self._properties
-        permissions = properties[PROP_PERMISSIONS]
         prop_format = properties[PROP_FORMAT]
         hap_rep = {
             HAP_REPR_IID: self.broker.iid_manager.get_iid(self),
             HAP_REPR_TYPE: self._uuid_str,
-            HAP_REPR_PERM: permissions,
+            HAP_REPR_PERM: properties[PROP_PERMISSIONS],
             HAP_REPR_FORMAT: prop_format,
         }
         # HAP_REPR_DESC (description) is optional and takes up
@@ -432,9 +529,9 @@ class Characteristic:
             hap_rep[HAP_REPR_DESC] = display_name
 
         if prop_format in HAP_FORMAT_NUMERICS:
-            hap_rep.update(
-                {k: properties[k] for k in PROP_NUMERIC.intersection(properties)}
-            )
+            for key in _PROP_NUMERIC_ORDERED:
+                if key in properties:
+                    hap_rep[key] = properties[key]
 
             if PROP_VALID_VALUES in properties:
                 hap_rep[HAP_REPR_VALID_VALUES] = sorted(
@@ -445,14 +542,6 @@ class Characteristic:
             if max_length != DEFAULT_MAX_LENGTH:
                 hap_rep[HAP_REPR_MAX_LEN] = max_length
 
-        if include_value and HAP_PERMISSION_READ in permissions:
-            hap_rep[HAP_REPR_VALUE] = self.get_value()
-
-        if not include_value:
-            self._to_hap_cache = hap_rep
-        elif not self.getter_callback:
-            # Only cache if there is no getter_callback
-            self._to_hap_cache_with_value = hap_rep
         return hap_rep
 
     @classmethod
@@ -3,11 +3,11 @@
 These are used to persist and load the state of the Accessory, so that
 it can work properly after a restart.
 """
-import json
 import uuid
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ed25519
+import orjson
 
 from .const import CLIENT_PROP_PERMS
 from .state import State
@@ -86,7 +86,7 @@ class AccessoryEncoder:
                 )
             ),
         }
-        json.dump(config_state, fp)
+        fp.write(orjson.dumps(config_state).decode())  # pylint: disable=no-member
 
     @staticmethod
     def load_into(fp, state: State) -> None:
@@ -94,7 +94,7 @@ class AccessoryEncoder:
 
         @see: AccessoryEncoder.persist
         """
-        loaded = json.load(fp)
+        loaded = orjson.loads(fp.read())  # pylint: disable=no-member
         state.mac = loaded["mac"]
         state.accessories_hash = loaded.get("accessories_hash")
         state.config_version = loaded["config_version"]
@@ -1,7 +1,6 @@
 """This module partially implements crypto for HAP."""
 from functools import partial
 import logging
-import struct
 from struct import Struct
 from typing import Iterable, List
 
@@ -15,7 +14,6 @@ logger = logging.getLogger(__name__)
 CRYPTO_BACKEND = default_backend()
 
 PACK_NONCE = partial(Struct("<LQ").pack, 0)
-PACK_LENGTH = Struct("H").pack
 
 
 class HAP_CRYPTO:
@@ -83,32 +81,33 @@ class HAPCrypto:
         crypt_in_buffer = self._crypt_in_buffer
         length_length = self.LENGTH_LENGTH
         tag_length = HAP_CRYPTO.TAG_LENGTH
+        total = len(crypt_in_buffer)
+        pos = 0
 
-        while len(crypt_in_buffer) > self.MIN_BLOCK_LENGTH:
-            block_length_bytes = crypt_in_buffer[:length_length]
-            block_size = struct.unpack("H", block_length_bytes)[0]
-            block_size_with_length = length_length + block_size + tag_length
+        with memoryview(crypt_in_buffer) as crypt_in_view:
+            while total - pos > self.MIN_BLOCK_LENGTH:
+                data_pos = pos + length_length
+                block_length_bytes = bytes(crypt_in_view[pos:data_pos])
+                block_size = int.from_bytes(block_length_bytes, "little")
+                data_size = block_size + tag_length
 
-            if len(crypt_in_buffer) < block_size_with_length:
-                logger.debug("Incoming buffer does not have the full block")
-                return result
+                if total < data_pos + data_size:
+                    logger.debug("Incoming buffer does not have the full block")
+                    break
 
-            # Trim off the length
-            del crypt_in_buffer[:length_length]
+                nonce = PACK_NONCE(self._in_count)
 
-            data_size = block_size + tag_length
-            nonce = PACK_NONCE(self._in_count)
+                result += self._in_cipher.decrypt(
+                    nonce,
+                    bytes(crypt_in_view[data_pos : data_pos + data_size]),
+                    block_length_bytes,
+                )
 
-            result += self._in_cipher.decrypt(
-                nonce,
-                bytes(crypt_in_buffer[:data_size]),
-                bytes(block_length_bytes),
-            )
+                self._in_count += 1
+                pos = data_pos + data_size
 
-            self._in_count += 1
-
-            # Now trim out the decrypted data
-            del crypt_in_buffer[:data_size]
+        # Trim out the decrypted blocks in one go
+        del crypt_in_buffer[:pos]
 
         return result
 
@@ -119,7 +118,7 @@ class HAPCrypto:
         total = len(data)
         while offset < total:
             length = min(total - offset, self.MAX_BLOCK_LENGTH)
-            length_bytes = PACK_LENGTH(length)
+            length_bytes = length.to_bytes(2, "little")
             block = bytes(data[offset : offset + length])
             nonce = PACK_NONCE(self._out_count)
             result.append(length_bytes)
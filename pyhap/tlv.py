@@ -1,9 +1,10 @@
 """Encodes and decodes Tag-Length-Value (tlv8) data."""
-import struct
 from typing import Any, Dict
 
 from pyhap import util
 
+_LENGTHS = tuple(bytes((length,)) for length in range(256))
+
 
 def encode(*args, to_base64=False):
     """Encode the given byte args in TLV format.
@@ -23,20 +24,25 @@ def encode(*args, to_base64=False):
         raise ValueError(f"Even number of args expected ({arg_len} given)")
 
     pieces = []
-    for x in range(0, len(args), 2):
+    append = pieces.append
+    for x in range(0, arg_len, 2):
         tag = args[x]
         data = args[x + 1]
         total_length = len(data)
-        if len(data) <= 255:
-            encoded = tag + struct.pack("B", total_length) + data
+        if total_length <= 255:
+            append(tag)
+            append(_LENGTHS[total_length])
+            append(data)
         else:
-            encoded = b""
             for y in range(0, total_length // 255):
-                encoded = encoded + tag + b"\xFF" + data[y * 255 : (y + 1) * 255]
+                append(tag)
+                append(b"\xFF")
+                append(data[y * 255 : (y + 1) * 255])
             remaining = total_length % 255
-            encoded = encoded + tag + struct.pack("B", remaining) + data[-remaining:]
-
-        pieces.append(encoded)
+            if remaining:
+                append(tag)
+                append(_LENGTHS[remaining])
+                append(data[-remaining:])
 
     result = b"".join(pieces)
 
@@ -1,9 +1,15 @@
 """Tests for pyhap.camera."""
+import base64
+import copy
 from unittest.mock import Mock, patch
 from uuid import UUID
 
+import pytest
+
 from pyhap import camera
 
+from . import AsyncMock
+
 _OPTIONS = {
     "stream_count": 4,
     "video": {
@@ -40,6 +46,31 @@ _OPTIONS = {
 }
 
 
+_SELECTED_CONFIG_REQ = (
+    "ARUCAQEBEKzMbMEFY0UVjal0tFCQBpECNAEBAAIJAQEAAgEAAwEAAwsBAoAC"
+    "AgJoAQMBHgQXAQFjAgQr66FSAwKEAAQEAAAAPwUCYgUDLAEBAgIMAQEBAgEA"
+    "AwEBBAEeAxYBAW4CBMUInmQDAhgABAQAAKBABgENBAEA"
+)
+
+_SESSION_ID = UUID("accc6cc1-0563-4515-8da9-74b450900691")
+
+
+def _add_session(acc):
+    """Add the session that _SELECTED_CONFIG_REQ refers to and return its info."""
+    session_info = {
+        "id": _SESSION_ID,
+        "stream_idx": 0,
+        "address": "192.168.1.114",
+        "v_port": 50483,
+        "v_srtp_key": "2JZgpMkwWUH8ahUtzp8VThtBmbk26hCPJqeWpYDR",
+        "a_port": 54956,
+        "a_srtp_key": "CkT0kVWqhnjZhEkyKI8TYvxaSNMu0a/TBpacuj2B",
+        "process": None,
+    }
+    acc.sessions[_SESSION_ID] = session_info
+    return session_info
+
+
 def test_init(mock_driver):
     """Test that the camera init properly computes TLV values"""
     acc = camera.Camera(_OPTIONS, mock_driver, "Camera")
@@ -95,9 +126,11 @@ def test_set_selected_stream_start_stop(mock_driver):
         pass
 
     process_mock = Mock()
+    exec_args = []
 
     # Mock for asyncio.create_subprocess_exec
     async def subprocess_exec(*args, **kwargs):  # pylint: disable=unused-argument
+        exec_args.append(args)
         process_mock.id = 42
         process_mock.communicate = communicate
         process_mock.wait = wait
@@ -132,6 +165,11 @@ def test_set_selected_stream_start_stop(mock_driver):
     acc.set_selected_stream_configuration(selected_config_req)
 
     assert acc.streaming_status == camera.STREAMING_STATUS["STREAMING"]
+    cmd = exec_args[0]
+    assert cmd[0] == "ffmpeg"
+    assert "-srtp_out_params" in cmd
+    assert cmd[cmd.index("-srtp_out_params") + 1] == session_info["v_srtp_key"]
+    assert cmd[-1].startswith("srtp://192.168.1.114:50483?rtcpport=50483&")
 
     selected_config_stop_req = "ARUCAQABEKzMbMEFY0UVjal0tFCQBpE="
     acc.set_selected_stream_configuration(selected_config_stop_req)
@@ -141,3 +179,182 @@ def test_set_selected_stream_start_stop(mock_driver):
     assert session_id not in acc.sessions
     assert process_mock.terminate.called
     assert acc.streaming_status == camera.STREAMING_STATUS["AVAILABLE"]
+
+
+def test_supported_configs_are_memoized(mock_driver):
+    """Test that cameras with equal options share the supported configurations."""
+    acc = camera.Camera(_OPTIONS, mock_driver, "Camera")
+    acc2 = camera.Camera(copy.deepcopy(_OPTIONS), mock_driver, "Camera2")
+
+    for char_name in (
+        "SupportedRTPConfiguration",
+        "SupportedVideoStreamConfiguration",
+        "SupportedAudioStreamConfiguration",
+    ):
+        value = acc.get_service("CameraRTPStreamManagement").get_characteristic(
+            char_name
+        ).value
+        value2 = acc2.get_service("CameraRTPStreamManagement").get_characteristic(
+            char_name
+        ).value
+        assert value is value2
+
+
+def test_supported_configs_memoization_is_bounded():
+    """Test that the memoized configurations are kept in a bounded cache."""
+    for get_config in (
+        camera.Camera.get_supported_video_stream_config,
+        camera.Camera.get_supported_audio_stream_config,
+    ):
+        assert get_config.cache_info().maxsize == 32
+
+    audio_params = {"codecs": [{"type": "OPUS", "samplerate": 24}], "extra": {1, 2}}
+    # Unhashable parameters are not cached, but still produce the configuration
+    assert camera.Camera.get_supported_audio_stream_config(audio_params)
+
+
+def test_get_snapshot_default(mock_driver):
+    """Test that the default snapshot is read from disk only once."""
+    acc = camera.Camera(_OPTIONS, mock_driver, "Camera")
+    snapshot = acc.get_snapshot({"image-width": 300, "image-height": 200})
+    assert snapshot.startswith(b"\xff\xd8")
+    assert acc.get_snapshot({"image-width": 640, "image-height": 480}) is snapshot
+
+
+def test_stream_address_version(mock_driver):
+    """Test that the address version is derived from the stream address."""
+    acc = camera.Camera(_OPTIONS, mock_driver, "Camera")
+    assert acc.stream_address_isv6 == camera.SETUP_IPV["IPV4"]
+
+    options = {**_OPTIONS, "address": "fd00::1"}
+    acc = camera.Camera(options, mock_driver, "Camera")
+    assert acc.stream_address_isv6 == camera.SETUP_IPV["IPV6"]
+
+    options = {**_OPTIONS, "address": "camera.local"}
+    with pytest.raises(ValueError):
+        camera.Camera(options, mock_driver, "Camera")
+
+
+def test_audio_config_fallback():
+    """Test that OPUS 24kHz is advertised when no configured codec is usable."""
+    default_config = camera.Camera.get_supported_audio_stream_config(
+        {"codecs": [{"type": "OPUS", "samplerate": 24}]}
+    )
+    assert (
+        camera.Camera.get_supported_audio_stream_config(
+            {"codecs": [{"type": "PCMU", "samplerate": 24}]}
+        )
+        == default_config
+    )
+    assert (
+        camera.Camera.get_supported_audio_stream_config(
+            {"codecs": [{"type": "OPUS", "samplerate": 48}]}
+        )
+        == default_config
+    )
+
+
+def test_start_stream_hardware_encoder(mock_driver):
+    """Test that hardware encoders get the negotiated H.264 profile and level."""
+    exec_args = []
+
+    async def subprocess_exec(*args, **kwargs):  # pylint: disable=unused-argument
+        exec_args.append(args)
+        return Mock()
+
+    options = {**_OPTIONS, "video_encoder": "h264_videotoolbox"}
+    acc = camera.Camera(options, mock_driver, "Camera")
+    _add_session(acc)
+
+    with patch("asyncio.create_subprocess_exec", new=subprocess_exec):
+        acc.set_selected_stream_configuration(_SELECTED_CONFIG_REQ)
+
+    cmd = exec_args[0]
+    assert cmd[cmd.index("-vcodec") + 1] == "h264_videotoolbox"
+    assert cmd[cmd.index("-profile:v") + 1] == "baseline"
+    assert cmd[cmd.index("-level") + 1] == "3.1"
+    assert "-tune" not in cmd
+
+
+def test_start_stream_unsupported_profile(mock_driver):
+    """Test that an unsupported H.264 profile falls back to the default one."""
+    exec_args = []
+
+    async def subprocess_exec(*args, **kwargs):  # pylint: disable=unused-argument
+        exec_args.append(args)
+        return Mock()
+
+    # Select the unknown profile ID 5 instead of baseline
+    selected_config = base64.b64decode(_SELECTED_CONFIG_REQ)
+    codec_params = b"\x01\x01\x00\x02\x01\x00\x03\x01\x00"
+    assert selected_config.count(codec_params) == 1
+    selected_config = selected_config.replace(
+        codec_params, b"\x01\x01\x05\x02\x01\x00\x03\x01\x00"
+    )
+
+    options = {**_OPTIONS, "video_encoder": "h264_videotoolbox"}
+    acc = camera.Camera(options, mock_driver, "Camera")
+    _add_session(acc)
+
+    with patch("asyncio.create_subprocess_exec", new=subprocess_exec):
+        acc.set_selected_stream_configuration(
+            base64.b64encode(selected_config).decode()
+        )
+
+    assert acc.streaming_status == camera.STREAMING_STATUS["STREAMING"]
+    cmd = exec_args[0]
+    assert cmd[cmd.index("-profile:v") + 1] == "baseline"
+    assert cmd[cmd.index("-level") + 1] == "3.1"
+
+
+def test_start_stream_invalid_cmd(mock_driver):
+    """Test that a command with unknown parameters does not start a stream."""
+    subprocess_exec = AsyncMock()
+    options = {**_OPTIONS, "start_stream_cmd": "ffmpeg -i {v_source}"}
+    acc = camera.Camera(options, mock_driver, "Camera")
+    _add_session(acc)
+
+    with patch("asyncio.create_subprocess_exec", new=subprocess_exec):
+        acc.set_selected_stream_configuration(_SELECTED_CONFIG_REQ)
+
+    assert not subprocess_exec.called
+    assert _SESSION_ID not in acc.sessions
+    assert acc.streaming_status == camera.STREAMING_STATUS["AVAILABLE"]
+
+
+def test_unsupported_video_encoder(mock_driver):
+    """Test that an unknown video encoder is rejected."""
+    options = {**_OPTIONS, "video_encoder": "h265_magic"}
+    with pytest.raises(ValueError):
+        camera.Camera(options, mock_driver, "Camera")
+
+
+def test_start_stop_audio_stream_process(mock_driver):
+    """Test that the audio is streamed in its own process when configured."""
+    processes = []
+
+    async def communicate():
+        return (None, "stderr")
+
+    async def subprocess_exec(*args, **kwargs):  # pylint: disable=unused-argument
+        process = Mock(args=args, communicate=communicate)
+        processes.append(process)
+        return process
+
+    options = {**_OPTIONS, "start_audio_stream_cmd": "audio-streamer {a_port}"}
+    acc = camera.Camera(options, mock_driver, "Camera")
+    _add_session(acc)
+
+    with patch("asyncio.create_subprocess_exec", new=subprocess_exec):
+        acc.set_selected_stream_configuration(_SELECTED_CONFIG_REQ)
+        assert acc.streaming_status == camera.STREAMING_STATUS["STREAMING"]
+        assert len(processes) == 2
+        video_process, audio_process = processes[0], processes[1]
+        assert video_process.args[0] == "ffmpeg"
+        assert audio_process.args == ("audio-streamer", "54956")
+
+        acc.set_selected_stream_configuration("ARUCAQABEKzMbMEFY0UVjal0tFCQBpE=")
+
+    assert video_process.terminate.called
+    assert audio_process.terminate.called
+    assert acc.streaming_status == camera.STREAMING_STATUS["AVAILABLE"]
@@ -115,6 +115,39 @@ def test_override_properties_properties():
     assert char.properties["step"] == new_properties["step"]
 
 
+def test_override_properties_updates_validation():
+    """Test that values are validated against the overridden properties."""
+    char = get_char(PROPERTIES.copy(), min_value=1, max_value=5)
+    assert char.to_valid_value(8) == 5
+    char.override_properties(properties={"maxValue": 11, "minStep": 2})
+    assert char.to_valid_value(7) == 7
+    assert char.to_valid_value(8) == 9
+    assert char.to_valid_value(12) == 11
+
+
+def test_properties_modified_in_place():
+    """Test that validation follows properties that are modified in place."""
+    props = PROPERTIES.copy()
+    char = get_char(props, min_value=1, max_value=5)
+    assert char.properties is props
+    props["maxValue"] = 10
+    char.set_value(8)
+    assert char.value == 8
+    del props["maxValue"]
+    assert char.to_valid_value(20) == 20
+
+
+def test_valid_values_modified_in_place():
+    """Test that valid values edited in place are checked."""
+    valid_values = {"foo": 2, "bar": 3}
+    char = get_char(PROPERTIES.copy(), valid=valid_values)
+    char.properties["ValidValues"]["baz"] = 4
+    char.valid_value_or_raise(4)
+    del char.properties["ValidValues"]["foo"]
+    with pytest.raises(ValueError):
+        char.valid_value_or_raise(2)
+
+
 def test_override_properties_exceed_max_length():
     """Test if overriding the properties with invalid values throws."""
     new_properties = {"minValue": 10, "maxValue": 20, "step": 1, "maxLen": 5000}
@@ -129,6 +162,9 @@ def test_override_properties_valid_values():
     char = get_char(PROPERTIES.copy(), valid={"foo": 1, "bar": 2})
     char.override_properties(valid_values=new_valid_values)
     assert char.properties["ValidValues"] == new_valid_values
+    char.valid_value_or_raise(3)
+    with pytest.raises(ValueError):
+        char.valid_value_or_raise(1)
 
 
 def test_override_properties_error():
@@ -138,6 +174,38 @@ def test_override_properties_error():
         char.override_properties()
 
 
+def test_to_valid_value_adjusted_max_value():
+    """Test that values are capped at the last minStep from minValue."""
+    props = PROPERTIES_FLOAT.copy()
+    props["minValue"] = 10
+    props["maxValue"] = 38.05
+    props["minStep"] = 0.1
+    char = get_char(props)
+    assert char.to_valid_value(38.05) == 38
+    assert char.to_valid_value(50) == 38
+    assert char.to_valid_value(37.9) == 37.9
+
+    props = PROPERTIES.copy()
+    props["minValue"] = 0
+    props["maxValue"] = 10
+    props["minStep"] = 3
+    char = get_char(props)
+    assert char.to_valid_value(12) == 9
+
+
+def test_to_valid_value_min_value_off_step():
+    """Test that values are stepped from a minValue that is off the minStep grid."""
+    props = PROPERTIES_FLOAT.copy()
+    props["minValue"] = 0.5
+    props["maxValue"] = 10
+    props["minStep"] = 1
+    char = get_char(props)
+    assert char.to_valid_value(0) == 0.5
+    assert char.to_valid_value(3.2) == 3.5
+    assert char.to_valid_value(9.7) == 9.5
+    assert char.to_valid_value(20) == 9.5
+
+
 @pytest.mark.parametrize("int_format", HAP_FORMAT_INTS)
 def test_set_value_invalid_min_step(int_format):
     """Test setting the value of a characteristic that is outside the minStep."""
@@ -327,6 +395,45 @@ def test_set_value_float():
         assert mock_notify.call_count == 1
 
 
+def test_set_value_unchanged():
+    """Test that setting the current value again skips validation."""
+    # pylint: disable=protected-access
+    char = get_char(PROPERTIES.copy(), min_value=1, max_value=10)
+    char.set_value(5)
+    validate = char._validate = MagicMock(side_effect=char._validate)
+    with patch.object(char, "broker") as mock_broker:
+        char.set_value(5)
+        assert validate.call_count == 0
+        assert mock_broker.publish.call_count == 0
+
+        char.set_value(5.0)
+        assert validate.call_count == 1
+        assert char.value == 5
+
+        char.set_value(6)
+        assert validate.call_count == 2
+        assert mock_broker.publish.call_count == 1
+    assert char.value == 6
+
+
+def test_set_value_unchanged_not_validated():
+    """Test that a current value which was never validated is validated again."""
+    char = get_char(PROPERTIES.copy(), min_value=1, max_value=10)
+    char.set_value(5)
+    char.value = 12
+    with patch.object(char, "broker"):
+        char.set_value(12)
+    assert char.value == 10
+
+    char = get_char(PROPERTIES.copy(), valid={"foo": 0, "bar": 2})
+    char.allow_invalid_client_values = True
+    with patch.object(char, "broker"):
+        char.client_update_value(3)
+        assert char.value == 3
+        with pytest.raises(ValueError):
+            char.set_value(3)
+
+
 def test_client_update_value():
     """Test updating the characteristic value with call from the driver."""
     path_notify = "pyhap.characteristic.Characteristic.notify"
@@ -471,6 +578,21 @@ def test_to_HAP_string_max_length_override():
     assert hap_repr["value"] == longer_than_sixty_four
 
 
+def test_to_HAP_value_change():
+    """Test that a value change only refreshes the value in the HAP representation."""
+    char = get_char(PROPERTIES.copy(), min_value=1, max_value=10)
+    with patch.object(char, "broker") as mock_broker:
+        mock_broker.iid_manager.get_iid.return_value = 2
+        hap_repr = char.to_HAP()
+        hap_repr_without_value = char.to_HAP(include_value=False)
+        assert hap_repr["value"] == 1
+
+        char.set_value(5)
+        assert char.to_HAP() == {**hap_repr, "value": 5}
+        assert char.to_HAP(include_value=False) is hap_repr_without_value
+        assert "value" not in hap_repr_without_value
+
+
 def test_to_HAP_bool():
     """Test created HAP representation for booleans."""
     # pylint: disable=protected-access
@@ -31,3 +31,24 @@ def test_round_trip():
     decrypted = crypto.decrypt()
 
     assert decrypted == plaintext
+
+
+def test_decrypt_keeps_partial_block():
+    """Test complete blocks are decrypted and a trailing partial block is kept."""
+    plaintext = b"bobdata1232" * 200
+    key = b"mykeydsfdsfdsfsdfdsfsdf"
+
+    crypto = hap_crypto.HAPCrypto(key)
+    crypto.OUT_CIPHER_INFO = crypto.IN_CIPHER_INFO
+    crypto.reset(key)
+
+    encrypted = b"".join(crypto.encrypt(plaintext))
+    first_block_length = (
+        crypto.LENGTH_LENGTH + crypto.MAX_BLOCK_LENGTH + hap_crypto.HAP_CRYPTO.TAG_LENGTH
+    )
+
+    crypto.receive_data(encrypted[: first_block_length + 10])
+    assert crypto.decrypt() == plaintext[: crypto.MAX_BLOCK_LENGTH]
+
+    crypto.receive_data(encrypted[first_block_length + 10 :])
+    assert crypto.decrypt() == plaintext[crypto.MAX_BLOCK_LENGTH :]
@@ -27,3 +27,22 @@ def test_tlv_invalid_pairs():
     """Test we encode fails with an odd amount of args."""
     with pytest.raises(ValueError):
         tlv.encode(b"\x01", b"A", b"\02")
+
+
+def test_tlv_round_trip_long_value():
+    """Test tlv splits values longer than 255 bytes into fragments."""
+    value = bytes(range(256)) * 2
+    message = tlv.encode(b"\x01", value, b"\x02", b"C")
+
+    assert message[:2] == b"\x01\xff"
+    assert len(message) == len(value) + 3 * 2 + 3
+    assert tlv.decode(message) == {b"\x01": value, b"\x02": b"C"}
+
+
+def test_tlv_round_trip_multiple_of_255():
+    """Test tlv does not add a trailing fragment to values of 255 byte multiples."""
+    value = bytes(range(255)) * 2
+    message = tlv.encode(b"\x01", value, b"\x02", b"C")
+
+    assert len(message) == len(value) + 2 * 2 + 3
+    assert tlv.decode(message) == {b"\x01": value, b"\x02": b"C"}